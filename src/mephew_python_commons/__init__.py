@@ -1,3 +1,3 @@
-from .logger_factory import LoggerFactory
+from .logger_factory import BufferedRotatingHandler, FastFormatter, GatedLogger, LoggerFactory
 
-__all__ = ["LoggerFactory"]
+__all__ = ["BufferedRotatingHandler", "FastFormatter", "GatedLogger", "LoggerFactory"]
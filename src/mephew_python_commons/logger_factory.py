@@ -3,30 +3,697 @@
 This module provides a LoggerFactory class to simplify the process of
 setting up a consistent logging structure across an application. It includes
 support for console logging and general/error-specific rotated log files.
+
+Records are handed off to a background listener thread through a queue, so the
+calling thread never blocks on file locking or I/O. The trade-off is that records
+still sitting in the queue are lost if the process is killed without running its
+exit handlers (e.g. SIGKILL or a hard crash).
+
+The listener threads don't survive `os.fork`, so in a forked child (e.g. a
+`multiprocessing` worker) the factory's loggers write synchronously instead.
 """
 
+import atexit
+import codecs
+import collections
+import copy
+import functools
+import locale
 import logging
+import logging.handlers
+import os
+import queue
 import threading
+import time
+import traceback
+import weakref
+from typing import Literal, overload
 
 from concurrent_log_handler import ConcurrentTimedRotatingFileHandler
 
+# The maximum number of buffers a single `os.writev` call accepts.
+try:
+    _IOV_MAX = os.sysconf("SC_IOV_MAX")
+except (AttributeError, ValueError, OSError):
+    _IOV_MAX = 1024
+# POSIX allows -1 for "no limit"; fall back to the common limit rather than an empty range.
+if _IOV_MAX <= 0:
+    _IOV_MAX = 1024
+
+
+class FastFormatter(logging.Formatter):
+    """A formatter for the `<LoggerName> <ThreadName>; <Time>; <LogLevel>; <Message>` format.
+
+    Produces the same output as a `logging.Formatter` with the format string
+    `"%(name)s %(threadName)s; %(asctime)s; %(levelname)s; %(message)s"`, but builds
+    the line directly instead of interpolating the format string for every record.
+    """
+
+    FORMAT = "%(name)s %(threadName)s; %(asctime)s; %(levelname)s; %(message)s"
+
+    def __init__(self, datefmt: str | None = None):
+        """Initializes the formatter.
+
+        Args:
+            datefmt (str | None, optional): The `time.strftime` format for the time.
+                Defaults to None, which uses the `logging.Formatter` default
+        """
+        super().__init__(self.FORMAT, datefmt)
+
+        # The most recently formatted time, as `(seconds, datefmt, formatted)`.
+        self._last_time: tuple[int, str, str] | None = None
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Formats the record. See `logging.Formatter.format`."""
+        record.message = record.getMessage()
+        s = f"{record.name} {record.threadName}; {self.formatTime(record, self.datefmt)}; {record.levelname}; {record.message}"
+
+        if record.exc_info and not record.exc_text:
+            # Cache the traceback text to avoid converting it multiple times.
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            if s[-1:] != "\n":
+                s += "\n"
+            s += record.exc_text
+        if record.stack_info:
+            if s[-1:] != "\n":
+                s += "\n"
+            s += self.formatStack(record.stack_info)
+
+        return s
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
+        """Formats the record's creation time, reusing the result for records from the same second.
+
+        See `logging.Formatter.formatTime`. Without a `datefmt` the default format
+        includes milliseconds, so it is not cached.
+        """
+        if datefmt is None:
+            return super().formatTime(record, datefmt)
+
+        seconds = int(record.created)
+        last_time = self._last_time
+        if last_time is not None and last_time[0] == seconds and last_time[1] == datefmt:
+            return last_time[2]
+
+        formatted = time.strftime(datefmt, self.converter(seconds))
+        self._last_time = (seconds, datefmt, formatted)
+        return formatted
+
+
+class GatedLogger:
+    """A thin logger wrapper that skips suppressed debug and info calls cheaply.
+
+    Whether the DEBUG and INFO levels are enabled is cached when the wrapper is
+    created and refreshed by `setLevel`, so a suppressed call costs a single boolean
+    check instead of a `LogRecord` allocation. Level changes made on the wrapped
+    logger directly (or on its ancestors) are only picked up after calling `refresh`.
+
+    All other attributes (e.g. `warning`, `error`, `exception`) are forwarded to the
+    wrapped logger.
+    """
+
+    __slots__ = ("_logger", "_debug", "_info")
+
+    def __init__(self, logger: logging.Logger):
+        """Initializes the wrapper.
+
+        Args:
+            logger (logging.Logger): The logger to wrap
+        """
+        self._logger = logger
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Re-reads the enabled levels from the wrapped logger."""
+        self._debug = self._logger.isEnabledFor(logging.DEBUG)
+        self._info = self._logger.isEnabledFor(logging.INFO)
+
+    def setLevel(self, level: int) -> None:
+        """Sets the level of the wrapped logger and refreshes the cached levels."""
+        self._logger.setLevel(level)
+        self.refresh()
+
+    def debug(self, msg: object, *args, **kwargs) -> None:
+        """Logs a DEBUG message if the level is enabled. See `logging.Logger.debug`."""
+        if self._debug:
+            # Skip this frame so the record points at the actual caller.
+            kwargs["stacklevel"] = kwargs.get("stacklevel", 1) + 1
+            self._logger.debug(msg, *args, **kwargs)
+
+    def info(self, msg: object, *args, **kwargs) -> None:
+        """Logs an INFO message if the level is enabled. See `logging.Logger.info`."""
+        if self._info:
+            kwargs["stacklevel"] = kwargs.get("stacklevel", 1) + 1
+            self._logger.info(msg, *args, **kwargs)
+
+    def __getattr__(self, name: str):
+        return getattr(self._logger, name)
+
+
+class _FlushScheduler:
+    """Flushes registered handlers periodically from a single background thread.
+
+    The thread wakes up at the shortest registered interval and flushes every
+    handler, so no handler keeps records buffered for longer than its interval.
+    Handlers are held weakly and should unregister themselves when closed.
+    """
+
+    def __init__(self):
+        self._intervals: weakref.WeakKeyDictionary[logging.Handler, float] = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def register(self, handler: logging.Handler, interval: float) -> None:
+        """Flushes `handler` at least every `interval` seconds from now on."""
+        with self._lock:
+            self._intervals[handler] = interval
+            self._start_thread()
+
+        # Let the thread pick up a possibly shorter interval.
+        self._wakeup.set()
+
+    def unregister(self, handler: logging.Handler) -> None:
+        """Stops flushing `handler`."""
+        with self._lock:
+            self._intervals.pop(handler, None)
+
+    def _start_thread(self) -> None:
+        """Starts the flush thread unless it is already running. Must be called with `self._lock` held."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="log-flush", daemon=True)
+            self._thread.start()
+
+    def _after_fork_in_child(self) -> None:
+        # Only the forking thread survives a fork, so the child needs its own flush thread.
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+
+        with self._lock:
+            if len(self._intervals):
+                self._start_thread()
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                interval = min(self._intervals.values(), default=None)
+
+            self._wakeup.wait(interval)
+            self._wakeup.clear()
+
+            with self._lock:
+                handlers = list(self._intervals)
+
+            for handler in handlers:
+                handler.flush()
+            del handlers
+
+
+_flush_scheduler = _FlushScheduler()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_flush_scheduler._after_fork_in_child)
+
+
+class BufferedRotatingHandler(ConcurrentTimedRotatingFileHandler):
+    """A `ConcurrentTimedRotatingFileHandler` that coalesces records into fewer writes.
+
+    Formatted records are encoded and collected in memory, then written out together
+    with a single `os.writev` on the log file's descriptor, so the file lock is taken
+    once per batch instead of once per record. The buffer is written when it reaches
+    `buffer_bytes`, every `flush_interval` seconds (by a background thread shared by
+    all instances), and whenever the handler is flushed or closed. With
+    `buffer_bytes=0` the buffer is written after every record (or every batch passed
+    to `handle_batch`).
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        *args,
+        buffer_bytes: int = 64 * 1024,
+        flush_interval: float = 0.2,
+        **kwargs,
+    ):
+        """Initializes the handler.
+
+        Args:
+            filename (str): The log file name
+            *args: Positional arguments for `ConcurrentTimedRotatingFileHandler`
+            buffer_bytes (int, optional): The buffered size (in bytes) at which
+                the buffer is written out. Defaults to 64 KiB
+            flush_interval (float, optional): The maximum time in seconds records stay
+                buffered. Defaults to 0.2
+            **kwargs: Keyword arguments for `ConcurrentTimedRotatingFileHandler`
+        """
+        self._buffer_bytes = buffer_bytes
+        self._buffer: list[bytes] = []
+        self._buffered_size = 0
+        self._last_record: logging.LogRecord | None = None
+
+        super().__init__(filename, *args, **kwargs)
+
+        # Records are encoded here and written below the text layer, so apply the
+        # encoding and newline translation the handler's text stream would have used.
+        self._stream_encoding = self.clh.encoding or locale.getpreferredencoding(False)
+        newline = self.clh.newline
+        self._line_separator = os.linesep if newline is None else newline or "\n"
+        self._encoding_options = (
+            self._stream_encoding,
+            self.clh.unicode_error_policy,
+            self.clh.terminator,
+            self._line_separator,
+        )
+
+        # Like the text stream, write a byte order mark (if the encoding has one) only at
+        # the start of an empty file, and encode records without one. Records are encoded
+        # with `final=True`, so the encoded bytes don't depend on earlier records.
+        self._byte_order_mark = codecs.getincrementalencoder(self._stream_encoding)(
+            self.clh.unicode_error_policy
+        ).encode("", final=True)
+        self._encoder = codecs.getincrementalencoder(self._stream_encoding)(self.clh.unicode_error_policy)
+        self._encoder.setstate(0)
+
+        if buffer_bytes > 0:
+            _flush_scheduler.register(self, flush_interval)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Adds the formatted record to the buffer, writing the buffer out once it is full."""
+        self._buffer_record(record)
+
+        if self._buffered_size >= self._buffer_bytes:
+            self._write_buffer()
+
+    def handle_batch(self, records: list[logging.LogRecord]) -> None:
+        """Handles several records at once, checking whether to write the buffer only once.
+
+        Args:
+            records (list[logging.LogRecord]): The records to handle, in order
+        """
+        self.acquire()
+        try:
+            for record in records:
+                if self.filter(record):
+                    self._buffer_record(record)
+
+            if self._buffered_size >= self._buffer_bytes:
+                self._write_buffer()
+        finally:
+            self.release()
+
+    def flush(self) -> None:
+        """Writes out all buffered records."""
+        # Avoid taking the lock when there is nothing to write, e.g. on idle periodic flushes.
+        if not self._buffer:
+            return
+
+        self.acquire()
+        try:
+            self._write_buffer()
+        finally:
+            self.release()
+
+    def close(self) -> None:
+        """Writes out all buffered records and closes the handler."""
+        _flush_scheduler.unregister(self)
+        self.flush()
+        super().close()
+
+    def _at_fork_reinit(self) -> None:
+        super()._at_fork_reinit()
+
+        # Called in a forked child. The buffered records belong to the parent, which writes them itself.
+        self._buffer = []
+        self._buffered_size = 0
+        self._last_record = None
+
+    def _buffer_record(self, record: logging.LogRecord) -> None:
+        """Formats, encodes and buffers a record. Must be called with `self.lock` held.
+
+        The encoded message is stored on the record, so other handlers with the same
+        formatter and encoding options (e.g. the general and error log handlers)
+        reuse it instead of formatting the record again.
+        """
+        key = (self.formatter, self._encoding_options)
+        encoded = record.__dict__.get("_encoded_message")
+        if encoded is not None and encoded[0] == key:
+            data = encoded[1]
+        else:
+            try:
+                msg = self.format(record) + self.clh.terminator
+                if self._line_separator != "\n":
+                    msg = msg.replace("\n", self._line_separator)
+                data = self._encoder.encode(msg, final=True)
+            except Exception:
+                self.handleError(record)
+                return
+
+            record._encoded_message = (key, data)
+
+        self._buffer.append(data)
+        self._buffered_size += len(data)
+        self._last_record = record
+
+    def _write_buffer(self) -> None:
+        """Writes all buffered records under a single file lock. Must be called with `self.lock` held."""
+        if not self._buffer:
+            return
+
+        chunks = self._buffer
+        record = self._last_record
+        self._buffer = []
+        self._buffered_size = 0
+        self._last_record = None
+
+        # Mirrors `ConcurrentTimedRotatingFileHandler.emit`, but for a whole batch of records.
+        try:
+            self.clh._do_lock()
+            try:
+                self.clh._check_stream()
+
+                try:
+                    if self.shouldRollover(record):
+                        self.doRollover()
+                except Exception as e:
+                    self._console_log(f"Unable to do rollover: {e}\n{traceback.format_exc()}")
+
+                self._write(chunks)
+            finally:
+                self.clh._do_unlock()
+        except (KeyboardInterrupt, SystemExit):
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def _write(self, chunks: list[bytes]) -> None:
+        """Writes already encoded data straight to the log file descriptor. Must be called with the file locked."""
+        clh = self.clh
+        if clh.stream is None or clh.stream.closed:
+            clh.stream = clh.do_open()
+
+        fd = clh.stream.fileno()
+        # The file is locked, so it can't have been written to since this check. This
+        # also covers files freshly created by a reopen or a rollover.
+        if self._byte_order_mark and os.fstat(fd).st_size == 0:
+            chunks = [self._byte_order_mark, *chunks]
+
+        if hasattr(os, "writev"):
+            # Submit the whole batch in one syscall without first copying it into a single buffer.
+            for start in range(0, len(chunks), _IOV_MAX):
+                part = chunks[start : start + _IOV_MAX]
+                written = os.writev(fd, part)
+                if written < sum(map(len, part)):
+                    _write_all(fd, b"".join(part)[written:])
+        else:
+            _write_all(fd, b"".join(chunks))
+
+        if not clh._actual_keep_log_stream_open:
+            clh._close()
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """Writes all of `data` to `fd`, retrying after partial writes."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view) :]
+
+
+class _LogQueueHandler(logging.handlers.QueueHandler):
+    """A `QueueHandler` that fans records out to several queues.
+
+    Each queue is served by its own listener, so a slow sink (e.g. a blocked stderr
+    pipe) doesn't hold up the others.
+
+    Like the stock `prepare`, records are copied before being stripped down, so other
+    handlers of the logger still see the original record. The listeners run on
+    separate threads, so only the first queue gets the prepared copy itself; every
+    other queue gets a shallow copy of it that its handlers can modify
+    (e.g. `Formatter.format` setting `asctime`) without racing the first listener.
+
+    After `handle_directly` is called, records skip the queues and are passed to the
+    given handlers on the caller's thread instead.
+    """
+
+    def __init__(self, *queues):
+        """Initializes the handler.
+
+        Args:
+            *queues: The queues to put every record in. The first one gets the
+                records themselves, the others get copies. May be empty if the
+                handler is switched to `handle_directly` before use
+        """
+        super().__init__(queues[0] if queues else None)
+
+        self.queues = queues
+        self._other_queues = queues[1:]
+        self._direct_handlers: tuple[logging.Handler, ...] | None = None
+
+    def handle_directly(self, *handlers: logging.Handler) -> None:
+        """Passes records straight to `handlers` from now on, instead of queueing them.
+
+        Args:
+            *handlers: The handlers to call for every record at or above their level
+        """
+        self._direct_handlers = handlers
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Queues the record, or passes it to the direct handlers if there are any."""
+        direct_handlers = self._direct_handlers
+        if direct_handlers is not None:
+            for handler in direct_handlers:
+                if record.levelno >= handler.level:
+                    handler.handle(record)
+            return
+
+        try:
+            self.enqueue(self.prepare(record))
+        except Exception:
+            self.handleError(record)
+
+    def close(self) -> None:
+        """Closes the direct handlers, if there are any, and the handler itself."""
+        for handler in self._direct_handlers or ():
+            handler.close()
+
+        super().close()
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Puts the record in the first queue and a copy of it in every other queue."""
+        # Copy before queueing anything, as the first listener may modify the record once it is queued.
+        copies = [copy.copy(record) for _ in self._other_queues]
+
+        self.queue.put_nowait(record)
+        for log_queue, record_copy in zip(self._other_queues, copies):
+            log_queue.put_nowait(record_copy)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Returns a copy of the record with the message and arguments merged and unneeded data dropped.
+
+        See `QueueHandler.prepare`.
+        """
+        msg = self.format(record)
+        record = copy.copy(record)
+        record.message = msg
+        record.msg = msg
+        record.args = None
+        record.exc_info = None
+        record.exc_text = None
+        record.stack_info = None
+
+        # Lets listeners skip the error log handler without checking its level.
+        record._route_error = record.levelno >= logging.ERROR
+        return record
+
+
+class _DropOldestQueue(queue.Queue):
+    """A queue holding at most `maxlen` items, which drops the oldest item when full.
+
+    `put` never blocks. The number of dropped items is counted and can be collected
+    with `pop_dropped`. Dropped items don't count as unfinished tasks, so only items
+    actually retrieved need a `task_done` call. Once a `QueueListener` sentinel is
+    queued, further items are dropped, so the sentinel itself can never be pushed out.
+    """
+
+    def __init__(self, maxlen: int):
+        self._maxlen = maxlen
+        self._dropped = 0
+        self._sentinel_queued = False
+
+        super().__init__()
+
+    def pop_dropped(self) -> int:
+        """Returns the number of items dropped since the last call."""
+        with self.mutex:
+            dropped, self._dropped = self._dropped, 0
+
+        return dropped
+
+    def _init(self, maxsize: int) -> None:
+        self.queue = collections.deque(maxlen=self._maxlen)
+
+    def _put(self, item) -> None:
+        # `put` counts every item as an unfinished task, so uncount each dropped one.
+        if self._sentinel_queued:
+            self._dropped += 1
+            self.unfinished_tasks -= 1
+            return
+
+        if len(self.queue) == self._maxlen:
+            self._dropped += 1
+            self.unfinished_tasks -= 1
+
+        self.queue.append(item)
+        self._sentinel_queued = item is logging.handlers.QueueListener._sentinel
+
+
+class _BatchingQueueListener(logging.handlers.QueueListener):
+    """A `QueueListener` that hands records to its handlers in batches.
+
+    Whenever the listener wakes up, it drains the records already waiting in the queue
+    (up to `MAX_BATCH_SIZE`) and passes them to handlers that implement `handle_batch`
+    in a single call. Other handlers, such as the stream handler, get the records one
+    by one, just like with a plain `QueueListener`.
+
+    If the queue drops records when full (see `_DropOldestQueue`), a warning with the
+    number of dropped records is handled ahead of the next batch. The warning is issued
+    at most once per `DROPPED_WARNING_INTERVAL` seconds; drops in between are added to
+    the count of the next one.
+
+    Records for the `error_handler` are selected by the `_route_error` flag set by
+    `_LogQueueHandler.prepare` rather than by comparing levels.
+    """
+
+    MAX_BATCH_SIZE = 1024
+    DROPPED_WARNING_INTERVAL = 0.2
+
+    def __init__(
+        self,
+        queue,
+        *handlers: logging.Handler,
+        respect_handler_level: bool = False,
+        error_handler: logging.Handler | None = None,
+    ):
+        super().__init__(queue, *handlers, respect_handler_level=respect_handler_level)
+
+        self._pop_dropped = getattr(queue, "pop_dropped", None)
+        self._error_handler = error_handler
+
+    def handle_batch(self, records: list[logging.LogRecord]) -> None:
+        """Passes a batch of records to every handler, respecting handler levels if configured."""
+        error_handler = self._error_handler
+        respect_handler_level = self.respect_handler_level
+
+        for handler in self.handlers:
+            if handler is error_handler:
+                handler_records = [record for record in records if record._route_error]
+            elif respect_handler_level:
+                handler_level = handler.level
+                handler_records = [record for record in records if record.levelno >= handler_level]
+            else:
+                handler_records = records
+
+            if not handler_records:
+                continue
+
+            if isinstance(handler, BufferedRotatingHandler):
+                handler.handle_batch(handler_records)
+            else:
+                handle = handler.handle
+                for record in handler_records:
+                    handle(record)
+
+    @staticmethod
+    def _make_dropped_record(dropped: int) -> logging.LogRecord:
+        record = logging.LogRecord(
+            __name__,
+            logging.WARNING,
+            __file__,
+            0,
+            "Dropped %d log records because the log queue was full",
+            (dropped,),
+            None,
+        )
+        record._route_error = False
+        return record
+
+    def _monitor(self) -> None:
+        # This loop runs for every record, so look everything up once.
+        dequeue = self.dequeue
+        queue_empty = self.queue.empty
+        sentinel = self._sentinel
+        max_batch_size = self.MAX_BATCH_SIZE
+        pop_dropped = self._pop_dropped
+        handle_batch = self.handle_batch
+        # Like the base `_monitor`, mark every retrieved item as done on queues that track tasks.
+        task_done = getattr(self.queue, "task_done", None)
+        monotonic = time.monotonic
+        warning_interval = self.DROPPED_WARNING_INTERVAL
+        dropped = 0
+        last_warning = -warning_interval
+        # The base `prepare` returns the record unchanged, so only call an override.
+        prepare = None if type(self).prepare is logging.handlers.QueueListener.prepare else self.prepare
+
+        while True:
+            batch = []
+            stop = False
+            dequeued = 0
+
+            record = dequeue(True)
+            while True:
+                dequeued += 1
+                if record is sentinel:
+                    stop = True
+                    break
+
+                batch.append(record if prepare is None else prepare(record))
+
+                # The listener is the queue's only consumer, so a non-empty queue
+                # guarantees the next non-blocking get succeeds.
+                if len(batch) >= max_batch_size or queue_empty():
+                    break
+
+                record = dequeue(False)
+
+            if pop_dropped is not None:
+                dropped += pop_dropped()
+                # A pending count is always reported before the listener stops.
+                if dropped and (stop or monotonic() - last_warning >= warning_interval):
+                    batch.insert(0, self._make_dropped_record(dropped))
+                    dropped = 0
+                    last_warning = monotonic()
+
+            if batch:
+                handle_batch(batch)
+
+            if task_done is not None:
+                for _ in range(dequeued):
+                    task_done()
+
+            if stop:
+                break
+
+
+class _ClassMethodAlias:
+    """A read-only class attribute that returns the result of calling a classmethod of its owner."""
+
+    def __init__(self, method_name: str):
+        self._method_name = method_name
+
+    def __get__(self, instance: object, owner: type) -> logging.Formatter:
+        return getattr(owner, self._method_name)()
+
 
 class LoggerFactory:
     """A factory for creating and configuring standardized logger instances."""
 
-    # Default formatter for log messages written to files.
+    # Default formatter for log messages written to files, created on first access.
     # Format: <LoggerName> <ThreadName>; <YYYY-MM-DD HH:MM:SS>; <LogLevel>; <Message>
-    DEFAULT_FILE_LOG_FORMATTER = logging.Formatter(
-        "%(name)s %(threadName)s; %(asctime)s; %(levelname)s; %(message)s",
-        "%Y-%m-%d %H:%M:%S",
-    )
+    DEFAULT_FILE_LOG_FORMATTER = _ClassMethodAlias("default_file_formatter")
 
-    # Default formatter for log messages written to the console (stream).
+    # Default formatter for log messages written to the console (stream), created on first access.
     # Format: <LoggerName> <ThreadName>; <HH:MM:SS>; <LogLevel>; <Message>
-    DEFAULT_STREAM_LOG_FORMATTER = logging.Formatter(
-        "%(name)s %(threadName)s; %(asctime)s; %(levelname)s; %(message)s",
-        "%H:%M:%S",
-    )
+    DEFAULT_STREAM_LOG_FORMATTER = _ClassMethodAlias("default_stream_formatter")
 
     def __init__(
         self,
@@ -34,8 +701,11 @@ class LoggerFactory:
         log_files_prefix: str,
         backup_count: int = 7,
         encoding: str = "utf-8",
-        file_log_formatter: logging.Formatter = DEFAULT_FILE_LOG_FORMATTER,
-        stream_log_formatter: logging.Formatter = DEFAULT_STREAM_LOG_FORMATTER,
+        file_log_formatter: logging.Formatter | None = None,
+        stream_log_formatter: logging.Formatter | None = None,
+        disable_caller_lookup: bool = False,
+        root_namespace: str | None = None,
+        max_queued: int | None = None,
     ):
         """Initializes the factory with a common logging configuration.
 
@@ -49,19 +719,145 @@ class LoggerFactory:
                 Defaults to 7
             encoding (str, optional): The encoding for log files
                 Defaults to "utf-8"
-            file_log_formatter (logging.Formatter, optional): The default formatter
-                for file-based logs. Defaults to `DEFAULT_FILE_LOG_FORMATTER`
-            stream_log_formatter (logging.Formatter, optional): The default formatter
-                for console-based logs. Defaults to `DEFAULT_STREAM_LOG_FORMATTER`
+            file_log_formatter (logging.Formatter | None, optional): The default formatter
+                for file-based logs. Defaults to `default_file_formatter()`
+            stream_log_formatter (logging.Formatter | None, optional): The default formatter
+                for console-based logs. Defaults to `default_stream_formatter()`
+            disable_caller_lookup (bool, optional): If True, calls `tune_runtime` to stop
+                the `logging` module from collecting caller and process information for
+                every record. This affects the whole process. Defaults to False
+            root_namespace (str | None, optional): The name of a logger to nest all
+                loggers created by this factory under, e.g. with "myapp",
+                `get_logger("db")` returns the `myapp.db` logger. Loggers using the
+                default sinks then share a single handler on the namespace logger and
+                simply propagate to it. The namespace logger is global, so it must not
+                be shared with another factory. If None, logger names are used as-is
+                and every logger gets its own handler. Defaults to None
+            max_queued (int | None, optional): The maximum number of records waiting in
+                each queue. Every set of sinks has separate queues for its file and
+                stream handlers, so up to twice as many records may be pending per set.
+                When a queue is full, its oldest records are dropped and a warning with
+                their count is logged instead, at most once per
+                `_BatchingQueueListener.DROPPED_WARNING_INTERVAL` seconds. If None, the
+                queues are unbounded. Defaults to None
+
+        Raises:
+            ValueError: If `max_queued` is not a positive number.
         """
+        if max_queued is not None and max_queued <= 0:
+            raise ValueError(f"max_queued must be a positive number or None, got {max_queued}")
+
+        if disable_caller_lookup:
+            self.tune_runtime()
+
         self._log_files_prefix = log_files_prefix
         self._backup_count = backup_count
         self._encoding = encoding
-        self._file_log_formatter = file_log_formatter
-        self._stream_log_formatter = stream_log_formatter
+        self._file_log_formatter = file_log_formatter or self.default_file_formatter()
+        self._stream_log_formatter = stream_log_formatter or self.default_stream_formatter()
+        self._root_namespace = root_namespace
+        self._max_queued = max_queued
+        # Whether new sinks write on the caller's thread instead of through a listener.
+        self._synchronous = False
 
-        self._lock = threading.Lock()
+        if root_namespace:
+            namespace_logger = logging.getLogger(root_namespace)
+            namespace_logger.propagate = False
+            namespace_logger.setLevel(logging.DEBUG)
+
+        # No lock guards these: configuration relies on single atomic operations
+        # (dict item assignment, `dict.setdefault`, `list.append`/`pop`, `Logger.addHandler`).
+        # Configured loggers, by the name passed to `get_logger`.
+        self._logger_cache: dict[str, logging.Logger] = {}
+        # Wrappers handed out by `get_logger(..., gated=True)`, refreshed on level changes.
+        self._gated_loggers: dict[logging.Logger, GatedLogger] = {}
+        self._listeners: list[logging.handlers.QueueListener] = []
+        self._handler_cache: dict[
+            tuple[str, str, logging.Formatter, logging.Formatter],
+            tuple[_LogQueueHandler, tuple[logging.handlers.QueueListener, ...]],
+        ] = {}
 
+        # Drain the queues on interpreter shutdown so buffered records are not lost.
+        atexit.register(self.stop)
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=self._after_fork_in_child)
+
+    @classmethod
+    @functools.cache
+    def default_file_formatter(cls) -> logging.Formatter:
+        """Returns the default formatter for log messages written to files.
+
+        Format: <LoggerName> <ThreadName>; <YYYY-MM-DD HH:MM:SS>; <LogLevel>; <Message>
+
+        The formatter is created on first use and shared afterwards.
+        """
+        return FastFormatter("%Y-%m-%d %H:%M:%S")
+
+    @classmethod
+    @functools.cache
+    def default_stream_formatter(cls) -> logging.Formatter:
+        """Returns the default formatter for log messages written to the console (stream).
+
+        Format: <LoggerName> <ThreadName>; <HH:MM:SS>; <LogLevel>; <Message>
+
+        The formatter is created on first use and shared afterwards.
+        """
+        return FastFormatter("%H:%M:%S")
+
+    @classmethod
+    def tune_runtime(cls, *, log_threads: bool = True) -> None:
+        """Disables per-record bookkeeping in the `logging` module that the default formats don't use.
+
+        This changes module-level flags of `logging` and therefore affects every logger
+        in the process. Afterwards `%(process)d` and `%(processName)s` are no longer
+        populated, and neither are the caller fields (`%(pathname)s`, `%(filename)s`,
+        `%(module)s`, `%(lineno)d`, `%(funcName)s`), which saves a stack walk per record.
+
+        Args:
+            log_threads (bool, optional): Whether to keep collecting thread information.
+                The default formatters use `%(threadName)s`, so only pass False if none
+                of the formatters in use do. Defaults to True
+        """
+        logging.logProcesses = False
+        logging.logMultiprocessing = False
+        if not log_threads:
+            logging.logThreads = False
+
+        # With no source file to compare frames against, `Logger.findCaller` is skipped.
+        logging._srcfile = None
+
+    def stop(self) -> None:
+        """Stops all background listeners, writing out any records still queued, and closes their handlers.
+
+        Called automatically at interpreter exit. The factory's handlers are removed
+        from its loggers, so records logged afterwards are not written to its sinks.
+        A later `get_logger` call configures the logger again, with handlers that
+        write synchronously, as no listener would be left to drain a new queue at exit.
+        """
+        # Detach first, so records logged while the listeners drain don't end up in a dead queue.
+        loggers = list(self._logger_cache.values())
+        if self._root_namespace:
+            loggers.append(logging.getLogger(self._root_namespace))
+
+        sinks = list(self._handler_cache.values())
+        for queue_handler, _ in sinks:
+            for logger in loggers:
+                logger.removeHandler(queue_handler)
+
+        self._synchronous = True
+        self._handler_cache.clear()
+        self._logger_cache.clear()
+
+        while self._listeners:
+            listener = self._listeners.pop()
+            listener.stop()
+            for handler in listener.handlers:
+                handler.close()
+
+        for queue_handler, _ in sinks:
+            queue_handler.close()
+
+    @overload
     def get_logger(
         self,
         name: str,
@@ -71,14 +867,41 @@ class LoggerFactory:
         error_log_file_name: str | None = None,
         file_log_formatter: logging.Formatter | None = None,
         stream_log_formatter: logging.Formatter | None = None,
-    ) -> logging.Logger:
+        gated: Literal[False] = False,
+    ) -> logging.Logger: ...
+
+    @overload
+    def get_logger(
+        self,
+        name: str,
+        *,
+        level: int,
+        log_file_name: str | None = None,
+        error_log_file_name: str | None = None,
+        file_log_formatter: logging.Formatter | None = None,
+        stream_log_formatter: logging.Formatter | None = None,
+        gated: Literal[True],
+    ) -> "GatedLogger": ...
+
+    def get_logger(
+        self,
+        name: str,
+        *,
+        level: int,
+        log_file_name: str | None = None,
+        error_log_file_name: str | None = None,
+        file_log_formatter: logging.Formatter | None = None,
+        stream_log_formatter: logging.Formatter | None = None,
+        gated: bool = False,
+    ) -> "logging.Logger | GatedLogger":
         """Sets up and returns a custom logger, with options to override factory settings.
 
         If an override argument (e.g., `log_file_name`) is not provided, this method
         will use the default configuration from the factory instance.
 
         Args:
-            name (str): The name of the logger, typically `__name__`
+            name (str): The name of the logger, typically `__name__`. It is nested
+                under the factory's `root_namespace`, if one is set
             level (int): The minimum logging level for the logger (e.g., logging.INFO)
             log_file_name (str | None, optional): Overrides the default general log
                 file name. If None, uses the factory's default: `{log_files_prefix}.log`
@@ -88,54 +911,268 @@ class LoggerFactory:
                 factory's default file formatter
             stream_log_formatter (logging.Formatter | None, optional): Overrides the
                 factory's default stream formatter
+            gated (bool, optional): If True, wraps the logger in a `GatedLogger`
+                that skips suppressed debug/info calls cheaply. The factory hands out
+                one wrapper per logger and refreshes it whenever a later `get_logger`
+                call lowers the logger's level. Defaults to False
 
         Returns:
-            logging.Logger: A configured logger instance.
+            logging.Logger | GatedLogger: A configured logger instance.
         """
-        with self._lock:
-            # Determine the final configuration, using overrides if provided, otherwise factory defaults.
-            final_log_file_name = log_file_name or f"{self._log_files_prefix}.log"
-            final_error_log_file_name = error_log_file_name or f"{self._log_files_prefix}.error.log"
-            final_file_formatter = file_log_formatter or self._file_log_formatter
-            final_stream_formatter = stream_log_formatter or self._stream_log_formatter
+        logger = self._get_logger(
+            name,
+            level=level,
+            log_file_name=log_file_name,
+            error_log_file_name=error_log_file_name,
+            file_log_formatter=file_log_formatter,
+            stream_log_formatter=stream_log_formatter,
+        )
 
-            logger = logging.getLogger(name)
+        if not gated:
+            return logger
 
-            if logger.handlers:
-                if logger.level > level:
-                    logger.setLevel(level)
+        gated_logger = self._gated_loggers.get(logger)
+        if gated_logger is None:
+            gated_logger = self._gated_loggers.setdefault(logger, self.make_gated(logger))
 
-                # Skip the rest of the configuration if the logger already has handlers to avoid duplicate handlers.
-                return logger
+        return gated_logger
 
-            logger.setLevel(level)
+    @staticmethod
+    def make_gated(logger: logging.Logger) -> "GatedLogger":
+        """Wraps a logger in a `GatedLogger` for use in hot loops.
+
+        Unlike wrappers returned by `get_logger(..., gated=True)`, the factory does not
+        track this wrapper, so call its `refresh` after changing the logger's level.
+
+        Args:
+            logger (logging.Logger): The logger to wrap
+
+        Returns:
+            GatedLogger: A wrapper caching whether the debug and info levels are enabled.
+        """
+        return GatedLogger(logger)
+
+    def _get_logger(
+        self,
+        name: str,
+        *,
+        level: int,
+        log_file_name: str | None,
+        error_log_file_name: str | None,
+        file_log_formatter: logging.Formatter | None,
+        stream_log_formatter: logging.Formatter | None,
+    ) -> logging.Logger:
+        """Returns the named logger, configuring it on first use. See `get_logger`."""
+        # Fast path: an already configured logger only needs its level adjusted.
+        # This skips `logging.getLogger`, which takes the logging module's lock.
+        logger = self._logger_cache.get(name)
+        if logger is not None:
+            return self._adjust_level(logger, level)
+
+        logger_name = f"{self._root_namespace}.{name}" if self._root_namespace else name
+        logger = logging.getLogger(logger_name)
+
+        if not self._root_namespace and logger.handlers:
+            # Skip the configuration if the logger already has handlers (e.g. from another
+            # factory) to avoid duplicate handlers.
+            self._logger_cache[name] = logger
+            return self._adjust_level(logger, level)
+
+        # Slow path: configure the logger. Two threads configuring the same logger at
+        # once end up with the same result, as every step below is idempotent.
+
+        # Determine the final configuration, using overrides if provided, otherwise factory defaults.
+        final_log_file_name = log_file_name or f"{self._log_files_prefix}.log"
+        final_error_log_file_name = error_log_file_name or f"{self._log_files_prefix}.error.log"
+        final_file_formatter = file_log_formatter or self._file_log_formatter
+        final_stream_formatter = stream_log_formatter or self._stream_log_formatter
+
+        logger.setLevel(level)
+
+        # Loggers with the same sinks share one set of handlers, so each log file is
+        # opened (and locked) by a single handler instance regardless of the logger count.
+        handler_key = (
+            final_log_file_name,
+            final_error_log_file_name,
+            final_file_formatter,
+            final_stream_formatter,
+        )
+        sinks = self._handler_cache.get(handler_key)
+        if sinks is None:
+            new_sinks = self._create_sinks(*handler_key)
+            sinks = self._handler_cache.setdefault(handler_key, new_sinks)
+            if sinks is new_sinks:
+                for listener in sinks[1]:
+                    self._listeners.append(listener)
+                    listener.start()
+            else:
+                # Another thread created the same sinks first; discard ours.
+                for listener in new_sinks[1]:
+                    for handler in listener.handlers:
+                        handler.close()
+
+        queue_handler = sinks[0]
+        uses_default_sinks = handler_key == self._default_handler_key()
+        if self._root_namespace and uses_default_sinks and self._propagates_to_namespace(logger):
+            # The default sinks are attached once to the namespace logger, which
+            # receives the records of all its descendants through propagation.
+            logging.getLogger(self._root_namespace).addHandler(queue_handler)
+        else:
             logger.propagate = False
+            logger.addHandler(queue_handler)
 
-            # Handler for writing ERROR level logs to a separate, rotated file.
-            error_log_file_handler = ConcurrentTimedRotatingFileHandler(
-                final_error_log_file_name,
-                when="midnight",
-                backupCount=self._backup_count,
-                encoding=self._encoding,
-            )
-            error_log_file_handler.setFormatter(final_file_formatter)
-            error_log_file_handler.setLevel(logging.ERROR)
-
-            # Handler for writing all logs to a general, rotated file.
-            general_log_file_handler = ConcurrentTimedRotatingFileHandler(
-                final_log_file_name,
-                when="midnight",
-                backupCount=self._backup_count,
-                encoding=self._encoding,
+        if self._root_namespace and not uses_default_sinks:
+            # Propagation now stops at this logger, so descendants relying on it to
+            # reach the default sinks need the default handler attached directly.
+            for other in list(self._logger_cache.values()):
+                if other.propagate and other.name.startswith(f"{logger_name}."):
+                    other.propagate = False
+                    other.addHandler(self._handler_cache[self._default_handler_key()][0])
+
+        self._logger_cache[name] = logger
+
+        return logger
+
+    def _propagates_to_namespace(self, logger: logging.Logger) -> bool:
+        """Returns whether records of `logger` reach the namespace logger through propagation."""
+        namespace_logger = logging.getLogger(self._root_namespace)
+
+        parent = logger.parent
+        while parent is not None and parent is not namespace_logger:
+            if not parent.propagate:
+                return False
+            parent = parent.parent
+
+        return True
+
+    def _default_handler_key(self) -> tuple[str, str, logging.Formatter, logging.Formatter]:
+        """Returns the handler cache key of the factory's default sinks."""
+        return (
+            f"{self._log_files_prefix}.log",
+            f"{self._log_files_prefix}.error.log",
+            self._file_log_formatter,
+            self._stream_log_formatter,
+        )
+
+    def _adjust_level(self, logger: logging.Logger, level: int) -> logging.Logger:
+        """Lowers the level of an already configured logger if a lower one is requested."""
+        if logger.level > level:
+            logger.setLevel(level)
+
+            gated_logger = self._gated_loggers.get(logger)
+            if gated_logger is not None:
+                gated_logger.refresh()
+
+        return logger
+
+    def _after_fork_in_child(self) -> None:
+        """Switches the sinks inherited by a forked child process to synchronous writes.
+
+        The listener threads don't survive a fork, and a forked child usually ends with
+        `os._exit`, which skips the exit handlers that would drain a queue. So in the
+        child, every record is written on the caller's thread by new, unbuffered handlers.
+        """
+        self._synchronous = True
+        self._listeners.clear()
+
+        for handler_key, (queue_handler, _) in list(self._handler_cache.items()):
+            queue_handler.handle_directly(*self._create_handlers(*handler_key, buffered=False))
+            self._handler_cache[handler_key] = (queue_handler, ())
+
+    def _create_sinks(
+        self,
+        log_file_name: str,
+        error_log_file_name: str,
+        file_log_formatter: logging.Formatter,
+        stream_log_formatter: logging.Formatter,
+    ) -> tuple[_LogQueueHandler, tuple[logging.handlers.QueueListener, ...]]:
+        """Creates the handlers for a set of sinks and the listeners to run them.
+
+        The listeners are not started yet. If the factory is synchronous, there are no
+        listeners and the returned handler passes records to the handlers directly.
+
+        Returns:
+            tuple[_LogQueueHandler, tuple[logging.handlers.QueueListener, ...]]:
+                A handler feeding the listeners' queues, and the listeners.
+        """
+        if self._synchronous:
+            queue_handler = _LogQueueHandler()
+            queue_handler.handle_directly(
+                *self._create_handlers(
+                    log_file_name, error_log_file_name, file_log_formatter, stream_log_formatter, buffered=False
+                )
             )
-            general_log_file_handler.setFormatter(final_file_formatter)
+            return queue_handler, ()
 
-            # Handler for writing logs to the console/stream (e.g., stdout).
-            stream_handler = logging.StreamHandler()
-            stream_handler.setFormatter(final_stream_formatter)
+        general_log_file_handler, error_log_file_handler, stream_handler = self._create_handlers(
+            log_file_name, error_log_file_name, file_log_formatter, stream_log_formatter
+        )
 
-            logger.addHandler(general_log_file_handler)
-            logger.addHandler(error_log_file_handler)
-            logger.addHandler(stream_handler)
+        # The logger itself only enqueues records; the actual handlers run on background
+        # listener threads, keeping file locking and I/O off the caller's path. The files
+        # and the stream get separate listeners, so a slow console can't stall the files.
+        file_queue = self._create_queue()
+        file_listener = _BatchingQueueListener(
+            file_queue,
+            general_log_file_handler,
+            error_log_file_handler,
+            respect_handler_level=True,
+            error_handler=error_log_file_handler,
+        )
 
-            return logger
+        stream_queue = self._create_queue()
+        stream_listener = _BatchingQueueListener(stream_queue, stream_handler, respect_handler_level=True)
+
+        return _LogQueueHandler(file_queue, stream_queue), (file_listener, stream_listener)
+
+    def _create_handlers(
+        self,
+        log_file_name: str,
+        error_log_file_name: str,
+        file_log_formatter: logging.Formatter,
+        stream_log_formatter: logging.Formatter,
+        *,
+        buffered: bool = True,
+    ) -> tuple[logging.Handler, logging.Handler, logging.Handler]:
+        """Creates the general log file, error log file and stream handlers for a set of sinks.
+
+        Args:
+            buffered (bool, optional): Whether the general log file handler buffers
+                records. Defaults to True
+
+        Returns:
+            tuple[logging.Handler, logging.Handler, logging.Handler]: The general log
+                file, error log file and stream handlers.
+        """
+        # Handler for writing ERROR level logs to a separate, rotated file.
+        # Unbuffered, so errors reach the disk as soon as the listener handles them.
+        error_log_file_handler = BufferedRotatingHandler(
+            error_log_file_name,
+            when="midnight",
+            backupCount=self._backup_count,
+            encoding=self._encoding,
+            buffer_bytes=0,
+        )
+        error_log_file_handler.setFormatter(file_log_formatter)
+        error_log_file_handler.setLevel(logging.ERROR)
+
+        # Handler for writing all logs to a general, rotated file. Unless `buffered`,
+        # it writes after every record, like the error log handler.
+        general_log_file_handler = BufferedRotatingHandler(
+            log_file_name,
+            when="midnight",
+            backupCount=self._backup_count,
+            encoding=self._encoding,
+            **({} if buffered else {"buffer_bytes": 0}),
+        )
+        general_log_file_handler.setFormatter(file_log_formatter)
+
+        # Handler for writing logs to the console/stream (e.g., stdout).
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(stream_log_formatter)
+
+        return general_log_file_handler, error_log_file_handler, stream_handler
+
+    def _create_queue(self) -> "queue.SimpleQueue | _DropOldestQueue":
+        """Creates a queue for a listener, bounded if `max_queued` is set."""
+        return _DropOldestQueue(self._max_queued) if self._max_queued is not None else queue.SimpleQueue()